@@ -9,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import AguasCoimbraAPI
 from .const import (
@@ -26,6 +27,8 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+TOKEN_STORAGE_VERSION = 1
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Águas de Coimbra from a config entry."""
@@ -40,9 +43,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     history_days = entry.options.get(CONF_HISTORY_DAYS, DEFAULT_HISTORY_DAYS)
 
-    # Create API client
+    # Create API client, restoring the auth token saved before the last
+    # shutdown so warm starts skip the /login round-trip
     session = async_get_clientsession(hass)
-    api = AguasCoimbraAPI(session, username, password)
+    store: Store[dict[str, str]] = Store(
+        hass, TOKEN_STORAGE_VERSION, f"{DOMAIN}_{entry.entry_id}_token"
+    )
+    stored_token = await store.async_load()
+
+    async def _save_token(token: str) -> None:
+        await store.async_save({"token": token})
+
+    api = AguasCoimbraAPI(
+        session,
+        username,
+        password,
+        auth_token=stored_token.get("token") if stored_token else None,
+        token_saver=_save_token,
+    )
 
     # Create coordinator
     coordinator = AguasCoimbraDataUpdateCoordinator(
@@ -1,9 +1,13 @@
 """API client for Águas de Coimbra."""
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     API_KEY,
@@ -21,6 +25,23 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request headers are constant apart from the auth token, so build them once
+# at import instead of per call
+_LOGIN_HEADERS = {
+    HEADER_CONTENT_TYPE: "application/json;charset=utf-8",
+    HEADER_API_KEY: API_KEY,
+    HEADER_ACCEPT: "application/json, text/plain, */*",
+}
+_BASE_AUTH_HEADERS = {
+    HEADER_API_KEY: API_KEY,
+    HEADER_ACCEPT: "application/json",
+}
+
+
+async def _error_body(response: aiohttp.ClientResponse) -> str:
+    """Read at most 512 bytes of an error response body for logging."""
+    return (await response.content.read(512)).decode(errors="replace")
+
 
 class AguasCoimbraAPIError(Exception):
     """Base exception for API errors."""
@@ -46,21 +67,39 @@ class AguasCoimbraAPI:
         session: aiohttp.ClientSession,
         username: str,
         password: str,
+        auth_token: str | None = None,
+        token_saver: Callable[[str], Awaitable[None]] | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        A previously saved auth token can be passed in to skip the initial
+        login; the existing 401 handling re-authenticates if it has expired.
+        When token_saver is given it is awaited with every freshly obtained
+        token so the caller can persist it.
+        """
         self._session = session
         self._username = username
         self._password = password
-        self._auth_token: str | None = None
+        self._auth_token = auth_token
+        self._token_saver = token_saver
+        # Serializes re-authentication so concurrent 401s from parallel
+        # requests result in a single /login round-trip
+        self._login_lock = asyncio.Lock()
+        self._headers = dict(_BASE_AUTH_HEADERS)
+        if auth_token:
+            self._headers[HEADER_AUTH_TOKEN] = auth_token
 
     async def login(self) -> str:
         """Authenticate and obtain X-Auth-Token."""
-        headers = {
-            HEADER_CONTENT_TYPE: "application/json;charset=utf-8",
-            HEADER_API_KEY: API_KEY,
-            HEADER_ACCEPT: "application/json, text/plain, */*",
-        }
-
+        stale_token = self._auth_token
+        async with self._login_lock:
+            # Another caller may have re-authenticated while we waited
+            if self._auth_token and self._auth_token != stale_token:
+                return self._auth_token
+            return await self._do_login()
+
+    async def _do_login(self) -> str:
+        """Perform the actual /login request (callers hold the login lock)."""
         payload = {
             "username": self._username,
             "password": self._password,
@@ -70,7 +109,7 @@ class AguasCoimbraAPI:
             async with self._session.post(
                 ENDPOINT_LOGIN,
                 json=payload,
-                headers=headers,
+                headers=_LOGIN_HEADERS,
                 allow_redirects=True,
             ) as response:
                 # X-Auth-Token is in response headers
@@ -84,12 +123,17 @@ class AguasCoimbraAPI:
                     _LOGGER.error(
                         "Login failed with status %s: %s",
                         response.status,
-                        await response.text(),
+                        await _error_body(response),
                     )
                     raise LoginError(f"Login failed with status {response.status}")
 
                 self._auth_token = auth_token
+                self._headers[HEADER_AUTH_TOKEN] = auth_token
                 _LOGGER.debug("Successfully authenticated with Águas de Coimbra")
+
+                if self._token_saver is not None:
+                    await self._token_saver(auth_token)
+
                 return auth_token
 
         except aiohttp.ClientError as err:
@@ -101,16 +145,10 @@ class AguasCoimbraAPI:
         if not self._auth_token:
             await self.login()
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
-
         try:
             async with self._session.get(
                 ENDPOINT_SUBSCRIPTIONS,
-                headers=headers,
+                headers=self._headers,
             ) as response:
                 if response.status == 401:
                     # Token expired, re-authenticate
@@ -122,12 +160,14 @@ class AguasCoimbraAPI:
                     _LOGGER.warning(
                         "Failed to get subscriptions with status %s: %s",
                         response.status,
-                        await response.text(),
+                        await _error_body(response),
                     )
                     # Return empty list if endpoint doesn't exist
                     return []
 
-                data = await response.json()
+                # orjson decodes the payload in C, skipping aiohttp's
+                # charset sniff and the stdlib parser
+                data = orjson.loads(await response.read())
                 _LOGGER.debug("Retrieved %d subscription(s)", len(data) if isinstance(data, list) else 0)
                 return data if isinstance(data, list) else []
 
@@ -141,18 +181,12 @@ class AguasCoimbraAPI:
         if not self._auth_token:
             await self.login()
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
-
         params = {"subscriptionId": subscription_id}
 
         try:
             async with self._session.get(
                 ENDPOINT_METERS,
-                headers=headers,
+                headers=self._headers,
                 params=params,
             ) as response:
                 if response.status == 401:
@@ -165,13 +199,15 @@ class AguasCoimbraAPI:
                     _LOGGER.error(
                         "Failed to get meters with status %s: %s",
                         response.status,
-                        await response.text(),
+                        await _error_body(response),
                     )
                     raise InvalidResponseError(
                         f"Failed to get meters: HTTP {response.status}"
                     )
 
-                data = await response.json()
+                # orjson decodes the payload in C, skipping aiohttp's
+                # charset sniff and the stdlib parser
+                data = orjson.loads(await response.read())
                 _LOGGER.debug("Retrieved %d meters", len(data) if isinstance(data, list) else 0)
                 return data if isinstance(data, list) else []
 
@@ -184,8 +220,15 @@ class AguasCoimbraAPI:
         meter_number: str,
         subscription_id: str,
         days: int = 90,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        """Get consumption data for a water meter."""
+        """Get consumption data for a water meter.
+
+        When the caller already holds readings up to ``since``, the request
+        window is narrowed to start just before it (with one day of overlap
+        for late corrections) and an If-Modified-Since header is sent so a
+        conditional-request-aware server can answer 304 with no payload.
+        """
         if not self._auth_token:
             await self.login()
 
@@ -193,11 +236,17 @@ class AguasCoimbraAPI:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
+        headers = self._headers
+        if since is not None:
+            overlap_start = (since - timedelta(days=1)).replace(tzinfo=None)
+            if overlap_start > start_date:
+                start_date = overlap_start
+            headers = {
+                **self._headers,
+                "If-Modified-Since": format_datetime(
+                    since.astimezone(timezone.utc), usegmt=True
+                ),
+            }
 
         params = {
             "codigoMarca": DEFAULT_BRAND_CODE,
@@ -218,19 +267,28 @@ class AguasCoimbraAPI:
                     # Token expired, re-authenticate
                     _LOGGER.warning("Auth token expired, re-authenticating")
                     await self.login()
-                    return await self.get_consumption(meter_number, subscription_id, days)
+                    return await self.get_consumption(
+                        meter_number, subscription_id, days, since
+                    )
+
+                if response.status == 304:
+                    # Nothing changed since the last fetch
+                    _LOGGER.debug("Consumption not modified since %s", since)
+                    return []
 
                 if response.status != 200:
                     _LOGGER.error(
                         "Failed to get consumption with status %s: %s",
                         response.status,
-                        await response.text(),
+                        await _error_body(response),
                     )
                     raise InvalidResponseError(
                         f"Failed to get consumption: HTTP {response.status}"
                     )
 
-                data = await response.json()
+                # orjson decodes the payload in C, skipping aiohttp's
+                # charset sniff and the stdlib parser
+                data = orjson.loads(await response.read())
 
                 if not isinstance(data, list):
                     _LOGGER.error("Unexpected response format: %s", type(data))
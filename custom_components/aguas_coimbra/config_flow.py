@@ -8,7 +8,6 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -40,19 +39,6 @@ STEP_SUBSCRIPTION_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
-    session = async_get_clientsession(hass)
-    api = AguasCoimbraAPI(session, data[CONF_USERNAME], data[CONF_PASSWORD])
-
-    # Validate credentials by attempting login
-    await api.login()
-
-    # Return info to be stored in the config entry
-    meter_number = data.get(CONF_METER_NUMBER, "Unknown")
-    return {"title": f"Águas de Coimbra {meter_number}"}
-
-
 class AguasCoimbraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Águas de Coimbra."""
 
@@ -65,6 +51,9 @@ class AguasCoimbraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._subscription_id: str | None = None
         self._meter_number: str | None = None
         self._discovered_contracts: list[dict[str, Any]] = []
+        # Single API client per flow; keeps the auth token from the initial
+        # login so later steps don't re-authenticate
+        self._api: AguasCoimbraAPI | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -74,12 +63,19 @@ class AguasCoimbraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate credentials
-                session = async_get_clientsession(self.hass)
-                api = AguasCoimbraAPI(
-                    session, user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
-                )
-                await api.login()
+                # Validate credentials; rebuild the client when the form is
+                # resubmitted with different credentials (e.g. after a
+                # failed login), otherwise reuse it and its auth token
+                if (
+                    self._api is None
+                    or user_input[CONF_USERNAME] != self._username
+                    or user_input[CONF_PASSWORD] != self._password
+                ):
+                    session = async_get_clientsession(self.hass)
+                    self._api = AguasCoimbraAPI(
+                        session, user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
+                    )
+                await self._api.login()
 
                 # Store credentials and meter number
                 self._username = user_input[CONF_USERNAME]
@@ -106,9 +102,11 @@ class AguasCoimbraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
-                # Try to auto-discover subscription ID
+                # Try to auto-discover subscription ID; the login above
+                # already primed the auth token, so this is a single
+                # round-trip with no re-authentication
                 _LOGGER.debug("Attempting to auto-discover subscription ID")
-                subscriptions = await api.get_user_subscriptions()
+                subscriptions = await self._api.get_user_subscriptions()
 
                 if subscriptions:
                     _LOGGER.info("Found %d subscription(s)", len(subscriptions))
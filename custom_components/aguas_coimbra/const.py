@@ -2,6 +2,12 @@
 from datetime import timedelta
 from typing import Final
 
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+
 # Integration domain
 DOMAIN: Final = "aguas_coimbra"
 
@@ -34,44 +40,50 @@ SENSOR_DAILY_CONSUMPTION: Final = "daily_consumption"
 SENSOR_WEEKLY_CONSUMPTION: Final = "weekly_consumption"
 SENSOR_MONTHLY_CONSUMPTION: Final = "monthly_consumption"
 
-# Sensor Configuration
-SENSOR_TYPES: Final = {
-    SENSOR_LATEST_READING: {
-        "name": "Latest Reading",
-        "icon": "mdi:water",
-        "unit": "L",
-        "device_class": "water",
-        "state_class": "measurement",
-    },
-    SENSOR_CUMULATIVE_TOTAL: {
-        "name": "Cumulative Total",
-        "icon": "mdi:counter",
-        "unit": "L",
-        "device_class": "water",
-        "state_class": "total_increasing",
-    },
-    SENSOR_DAILY_CONSUMPTION: {
-        "name": "Daily Consumption",
-        "icon": "mdi:water",
-        "unit": "L",
-        "device_class": "water",
-        "state_class": "total",
-    },
-    SENSOR_WEEKLY_CONSUMPTION: {
-        "name": "Weekly Consumption",
-        "icon": "mdi:water-outline",
-        "unit": "L",
-        "device_class": "water",
-        "state_class": "total",
-    },
-    SENSOR_MONTHLY_CONSUMPTION: {
-        "name": "Monthly Consumption",
-        "icon": "mdi:water-circle",
-        "unit": "L",
-        "device_class": "water",
-        "state_class": "total",
-    },
-}
+# Sensor Configuration; one immutable description shared by every entity
+# of a given type (attribute access instead of nested dict lookups)
+SENSOR_DESCRIPTIONS: Final[tuple[SensorEntityDescription, ...]] = (
+    SensorEntityDescription(
+        key=SENSOR_LATEST_READING,
+        name="Latest Reading",
+        icon="mdi:water",
+        native_unit_of_measurement="L",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_CUMULATIVE_TOTAL,
+        name="Cumulative Total",
+        icon="mdi:counter",
+        native_unit_of_measurement="L",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_DAILY_CONSUMPTION,
+        name="Daily Consumption",
+        icon="mdi:water",
+        native_unit_of_measurement="L",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_WEEKLY_CONSUMPTION,
+        name="Weekly Consumption",
+        icon="mdi:water-outline",
+        native_unit_of_measurement="L",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    SensorEntityDescription(
+        key=SENSOR_MONTHLY_CONSUMPTION,
+        name="Monthly Consumption",
+        icon="mdi:water-circle",
+        native_unit_of_measurement="L",
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL,
+    ),
+)
 
 # HTTP Headers
 HEADER_CONTENT_TYPE: Final = "Content-Type"
@@ -1,6 +1,8 @@
 """Data update coordinator for Águas de Coimbra."""
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+import heapq
 import logging
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -9,6 +11,48 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from .api import AguasCoimbraAPI, AguasCoimbraAPIError
 from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
 
+_TZ_CACHE: dict[str, timezone] = {}
+
+
+def _fast_parse_iso(raw: str) -> datetime:
+    """Parse the API's fixed YYYY-MM-DDTHH:MM:SS+HH:MM layout by slicing.
+
+    Several times faster than fromisoformat's general-purpose dispatch;
+    anything not matching the fixed layout falls through to the stdlib.
+    """
+    try:
+        parsed = datetime(
+            int(raw[0:4]),
+            int(raw[5:7]),
+            int(raw[8:10]),
+            int(raw[11:13]),
+            int(raw[14:16]),
+            int(raw[17:19]),
+        )
+        offset = raw[19:]
+        if not offset:
+            return parsed
+        if len(offset) == 6 and offset[0] in "+-" and offset[3] == ":":
+            tz = _TZ_CACHE.get(offset)
+            if tz is None:
+                sign = -1 if offset[0] == "-" else 1
+                tz = timezone(
+                    sign
+                    * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+                )
+                _TZ_CACHE[offset] = tz
+            return parsed.replace(tzinfo=tz)
+    except (ValueError, IndexError):
+        pass
+    return datetime.fromisoformat(raw)
+
+
+try:
+    # C parser, ~2x faster than the stdlib on the hot path
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover
+    _parse_iso = _fast_parse_iso
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -29,38 +73,156 @@ class AguasCoimbraDataUpdateCoordinator(DataUpdateCoordinator):
         self.meter_number = meter_number
         self.subscription_id = subscription_id
         self.history_days = history_days
+        # Parsed-date cache (raw string -> epoch seconds); consecutive
+        # refreshes fetch overlapping windows, so most date strings repeat
+        self._date_cache: dict[str, float] = {}
+        # Rolling window of readings keyed by date string, refreshed
+        # incrementally so each poll only fetches what is new
+        self._readings: dict[str, dict[str, Any]] = {}
+        # Per-calendar-day consumption sums, maintained incrementally as
+        # readings are merged; the daily/weekly/monthly totals are computed
+        # from these instead of re-scanning the whole window
+        self._daily_buckets: dict[date, float] = {}
+        # (today, first day of the weekly window), rebuilt only when the
+        # calendar day changes
+        self._today_cache: tuple[date, date] | None = None
+        # Last processed output, reused when a refresh changes nothing
+        self._last_processed: dict[str, Any] | None = None
+        self._processed_day: date | None = None
+        self._last_seen: datetime | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{meter_number}",
             update_interval=update_interval,
+            # Readings change at most a few times per day; skip listener
+            # callbacks (and state writes) when the processed data is unchanged
+            always_update=False,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Águas de Coimbra API."""
         try:
-            # Fetch consumption data
-            consumption_data = await self.api.get_consumption(
+            # Fetch readings newer than what we already hold
+            new_readings = await self.api.get_consumption(
                 self.meter_number,
                 self.subscription_id,
                 self.history_days,
+                since=self._last_seen,
             )
 
-            # Process and aggregate the data
-            processed_data = self._process_consumption_data(consumption_data)
+            # Merge into the rolling window; refetched overlap readings
+            # replace their previous entry, with the day bucket absorbing
+            # the difference
+            for reading in new_readings:
+                raw = reading.get("date")
+                if not raw:
+                    continue
+                try:
+                    day = date.fromtimestamp(self._parse_ts(reading))
+                except (ValueError, KeyError) as err:
+                    _LOGGER.warning("Error processing reading: %s", err)
+                    continue
+                bucket = self._daily_buckets.get(day, 0)
+                if (previous := self._readings.get(raw)) is not None:
+                    bucket -= previous.get("consumption", 0)
+                self._daily_buckets[day] = bucket + reading.get("consumption", 0)
+                self._readings[raw] = reading
+            evicted = self._evict_window()
 
-            _LOGGER.debug(
-                "Successfully updated data for meter %s: %s",
-                self.meter_number,
-                processed_data,
-            )
+            # Skip the whole parse/aggregate pipeline when the window and
+            # the calendar day are both unchanged (common when the API's
+            # rolling window has not advanced between polls)
+            today = date.today()
+            if (
+                new_readings
+                or evicted
+                or self._last_processed is None
+                or self._processed_day != today
+            ):
+                # Process and aggregate the data off the event loop; for large
+                # histories the parsing/aggregation is pure CPU work
+                processed_data = await self.hass.async_add_executor_job(
+                    self._process_consumption_data, list(self._readings.values())
+                )
+                self._last_processed = processed_data
+                self._processed_day = today
+            else:
+                processed_data = self._last_processed
+
+            if last_date := processed_data.get("last_reading_date"):
+                if (last_ts := self._date_cache.get(last_date)) is not None:
+                    self._last_seen = datetime.fromtimestamp(last_ts, tz=timezone.utc)
+
+            self._evict_date_cache()
+
+            # Log a short summary only; repr of the full processed dict
+            # walks every retained reading pair
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Successfully updated data for meter %s: latest=%s daily=%s readings=%d",
+                    self.meter_number,
+                    processed_data["latest_reading"],
+                    processed_data["daily_total"],
+                    len(processed_data["readings_epoch"]),
+                )
 
             return processed_data
 
         except AguasCoimbraAPIError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    def _parse_ts(self, reading: dict[str, Any]) -> float:
+        """Parse a reading's date string to epoch seconds, memoized across updates.
+
+        Comparing plain numbers in the aggregation loop is considerably
+        cheaper than datetime rich comparisons.
+        """
+        raw = reading["date"]
+        ts = self._date_cache.get(raw)
+        if ts is None:
+            # _parse_iso handles the +00:00/+01:00 offsets natively
+            ts = _parse_iso(raw).timestamp()
+            self._date_cache[raw] = ts
+        return ts
+
+    def _evict_window(self) -> int:
+        """Drop readings that have fallen out of the history window.
+
+        Returns the number of readings dropped.
+        """
+        cutoff = (
+            datetime.now().astimezone() - timedelta(days=self.history_days)
+        ).timestamp()
+        kept: dict[str, dict[str, Any]] = {}
+        for raw, reading in self._readings.items():
+            try:
+                if self._parse_ts(reading) >= cutoff:
+                    kept[raw] = reading
+            except (ValueError, KeyError):
+                continue
+        evicted = len(self._readings) - len(kept)
+        self._readings = kept
+
+        cutoff_day = date.fromtimestamp(cutoff)
+        self._daily_buckets = {
+            day: total
+            for day, total in self._daily_buckets.items()
+            if day >= cutoff_day
+        }
+        return evicted
+
+    def _evict_date_cache(self) -> None:
+        """Drop cached dates that can no longer appear in the fetch window."""
+        cutoff = (
+            datetime.now().astimezone() - timedelta(days=self.history_days * 2)
+        ).timestamp()
+        if len(self._date_cache) > self.history_days * 48:
+            self._date_cache = {
+                raw: ts for raw, ts in self._date_cache.items() if ts >= cutoff
+            }
+
     def _process_consumption_data(self, data: list[dict[str, Any]]) -> dict[str, Any]:
         """Process raw consumption data and calculate aggregates."""
         if not data:
@@ -71,55 +233,43 @@ class AguasCoimbraDataUpdateCoordinator(DataUpdateCoordinator):
                 "weekly_total": 0,
                 "monthly_total": 0,
                 "last_reading_date": None,
-                "all_readings": [],
+                "readings_epoch": [],
             }
 
-        # Sort by date (most recent first)
-        sorted_data = sorted(
-            data,
-            key=lambda x: datetime.fromisoformat(x["date"].replace("+00:00", "").replace("+01:00", "")),
-            reverse=True,
-        )
-
-        # Get latest reading
-        latest = sorted_data[0] if sorted_data else None
-        latest_reading = latest["consumption"] if latest else None
-        last_reading_date = latest["date"] if latest else None
-        cil = latest.get("cil") if latest else None
+        # Pair each reading with its parsed timestamp up front; shared by
+        # the latest-reading scan and the top-100 selection below
+        # Every reading here was validated (and its date parsed) at merge
+        # time, so the loop needs no per-iteration exception handling
+        keyed: list[tuple[float, dict[str, Any]]] = [
+            (self._parse_ts(reading), reading) for reading in data
+        ]
 
-        # Calculate date ranges
-        now = datetime.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=7)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        latest: dict[str, Any] | None = None
+        if keyed:
+            _, latest = max(keyed, key=itemgetter(0))
 
-        # Calculate totals for time-based sensors
-        daily_total = 0
+        # Totals come from the per-day buckets maintained at merge time:
+        # at most ~history_days additions instead of a full window re-scan
+        today = date.today()
+        if self._today_cache is None or self._today_cache[0] != today:
+            self._today_cache = (today, today - timedelta(days=7))
+        today, week_start_day = self._today_cache
+        daily_total = self._daily_buckets.get(today, 0)
         weekly_total = 0
         monthly_total = 0
+        for day, consumption in self._daily_buckets.items():
+            # Weekly total (last 7 days)
+            if day >= week_start_day:
+                weekly_total += consumption
+            # Monthly total (current month)
+            if day.year == today.year and day.month == today.month:
+                monthly_total += consumption
 
-        for reading in sorted_data:
-            try:
-                reading_date = datetime.fromisoformat(
-                    reading["date"].replace("+00:00", "").replace("+01:00", "")
-                )
-                consumption = reading.get("consumption", 0)
-
-                # Daily total (today only)
-                if reading_date >= today_start:
-                    daily_total += consumption
-
-                # Weekly total (last 7 days)
-                if reading_date >= week_start:
-                    weekly_total += consumption
-
-                # Monthly total (current month)
-                if reading_date >= month_start:
-                    monthly_total += consumption
+        latest_reading = latest["consumption"] if latest else None
+        last_reading_date = latest["date"] if latest else None
+        cil = latest.get("cil") if latest else None
 
-            except (ValueError, KeyError) as err:
-                _LOGGER.warning("Error processing reading: %s", err)
-                continue
+        top_readings = heapq.nlargest(100, keyed, key=itemgetter(0))
 
         return {
             "latest_reading": latest_reading,
@@ -129,5 +279,11 @@ class AguasCoimbraDataUpdateCoordinator(DataUpdateCoordinator):
             "last_reading_date": last_reading_date,
             "cil": cil,
             "meter_number": self.meter_number,
-            "all_readings": sorted_data[:100],  # Keep last 100 readings for cumulative sensor
+            # Last 100 readings as pre-parsed (epoch seconds, consumption)
+            # pairs, most recent first: downstream only ever needs the
+            # timestamp and the consumption, so the full per-reading dicts
+            # are not carried along
+            "readings_epoch": [
+                (ts, reading.get("consumption", 0)) for ts, reading in top_readings
+            ],
         }
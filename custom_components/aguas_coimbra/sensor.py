@@ -7,7 +7,7 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -16,15 +16,17 @@ from .const import (
     DOMAIN,
     SENSOR_CUMULATIVE_TOTAL,
     SENSOR_DAILY_CONSUMPTION,
+    SENSOR_DESCRIPTIONS,
     SENSOR_LATEST_READING,
     SENSOR_MONTHLY_CONSUMPTION,
-    SENSOR_TYPES,
     SENSOR_WEEKLY_CONSUMPTION,
 )
 from .coordinator import AguasCoimbraDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_DESCRIPTIONS = {description.key: description for description in SENSOR_DESCRIPTIONS}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -48,6 +50,10 @@ async def async_setup_entry(
 class AguasCoimbraSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Águas de Coimbra sensors."""
 
+    # The HA entity bases still carry a __dict__, but slotting our own
+    # attributes gives them descriptor-speed access and keeps them out of it
+    __slots__ = ("_sensor_type",)
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -59,13 +65,9 @@ class AguasCoimbraSensorBase(CoordinatorEntity, SensorEntity):
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._sensor_type = sensor_type
-
-        sensor_config = SENSOR_TYPES[sensor_type]
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config["icon"]
-        self._attr_native_unit_of_measurement = sensor_config["unit"]
-        self._attr_device_class = sensor_config.get("device_class")
-        self._attr_state_class = sensor_config.get("state_class")
+        # The shared description supplies name/icon/unit/device_class/
+        # state_class without per-entity copies
+        self.entity_description = _DESCRIPTIONS[sensor_type]
 
         # Device info
         self._attr_device_info = {
@@ -85,6 +87,8 @@ class AguasCoimbraSensorBase(CoordinatorEntity, SensorEntity):
 class AguasCoimbraLatestReadingSensor(AguasCoimbraSensorBase):
     """Sensor for the latest water consumption reading."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -123,6 +127,12 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
     - Never decreasing, even as old readings fall off the API's rolling window
     """
 
+    __slots__ = (
+        "_cumulative_value",
+        "_last_processed_date",
+        "_last_processed_epoch",
+    )
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -132,6 +142,9 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
         super().__init__(coordinator, entry, SENSOR_CUMULATIVE_TOTAL)
         self._cumulative_value: float = 0.0
         self._last_processed_date: str | None = None
+        # Epoch-seconds mirror of _last_processed_date; comparisons against
+        # the coordinator's pre-parsed readings are plain float compares
+        self._last_processed_epoch: float | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore last state when entity is added to hass."""
@@ -151,6 +164,11 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
                 if last_state.attributes:
                     self._last_processed_date = last_state.attributes.get("last_processed_date")
                     if self._last_processed_date:
+                        # Legacy states stored the date without an offset;
+                        # fromisoformat handles both forms
+                        self._last_processed_epoch = datetime.fromisoformat(
+                            self._last_processed_date
+                        ).timestamp()
                         _LOGGER.info(
                             "Restored last processed date: %s",
                             self._last_processed_date
@@ -162,60 +180,61 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
                 )
                 self._cumulative_value = 0.0
                 self._last_processed_date = None
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
+                self._last_processed_epoch = None
+
+        # Fold in the data the coordinator fetched before this entity was
+        # added; later refreshes arrive via _handle_coordinator_update
+        self._update_cumulative()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Fold new readings into the total once per refresh."""
+        self._update_cumulative()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_cumulative(self) -> None:
+        """Add consumption from not-yet-counted readings to the total.
+
+        Runs once per coordinator refresh; native_value stays a plain
+        read so Home Assistant can poll it repeatedly (state, recorder,
+        templates) without re-scanning or double-counting.
+        """
         if not self.coordinator.data:
-            # Return restored cumulative value even when coordinator data unavailable
-            # Return None only if we've never processed any data
-            if self._last_processed_date is None and self._cumulative_value == 0:
-                return None
-            return self._cumulative_value
-
-        # Get all readings from coordinator
-        all_readings = self.coordinator.data.get("all_readings", [])
-        if not all_readings:
-            # Return current cumulative value (could be 0 or restored value)
-            # Return None only if we've never processed any data
-            if self._last_processed_date is None and self._cumulative_value == 0:
-                return None
-            return self._cumulative_value
-
-        # Calculate incremental consumption from NEW readings only
-        incremental = 0.0
-        most_recent_date = self._last_processed_date
-
-        for reading in all_readings:
-            try:
-                reading_date_str = reading.get("date", "")
-                if not reading_date_str:
-                    continue
+            return
 
-                # Normalize the date string (remove timezone offsets for consistent comparison)
-                reading_date_str_clean = reading_date_str.replace("+00:00", "").replace("+01:00", "")
+        # Pre-parsed (epoch seconds, consumption) pairs from the coordinator
+        readings = self.coordinator.data.get("readings_epoch", [])
+        if not readings:
+            return
 
-                # If we have a last processed date, only count readings newer than it
-                if self._last_processed_date:
-                    if reading_date_str_clean <= self._last_processed_date:
-                        continue  # Skip already processed readings
+        # Calculate incremental consumption from NEW readings only; the
+        # coordinator already parsed the dates, so this is float compares
+        incremental = 0.0
+        most_recent_epoch = self._last_processed_epoch
 
-                # Add this reading's consumption
-                consumption = reading.get("consumption", 0)
-                incremental += consumption
+        # readings is sorted most recent first, so the first reading at or
+        # before the last processed timestamp ends the scan: the loop runs
+        # O(new readings) per refresh, not O(window)
+        for reading_ts, consumption in readings:
+            if (
+                self._last_processed_epoch is not None
+                and reading_ts <= self._last_processed_epoch
+            ):
+                break  # Everything after this is already counted
 
-                # Track the most recent reading date (use normalized version)
-                if most_recent_date is None or reading_date_str_clean > most_recent_date:
-                    most_recent_date = reading_date_str_clean
+            incremental += consumption
 
-            except (ValueError, KeyError, TypeError) as err:
-                _LOGGER.warning("Error processing reading for cumulative total: %s", err)
-                continue
+        # The newest reading leads the list
+        newest_ts = readings[0][0]
+        if most_recent_epoch is None or newest_ts > most_recent_epoch:
+            most_recent_epoch = newest_ts
 
         # Update cumulative value and last processed date
         # Important: Update last_processed_date even if incremental is 0
         # This marks that we've successfully processed readings
-        if most_recent_date is not None and most_recent_date != self._last_processed_date:
+        if most_recent_epoch is not None and most_recent_epoch != self._last_processed_epoch:
+            most_recent_date = self.coordinator.data.get("last_reading_date")
             if incremental > 0:
                 self._cumulative_value += incremental
                 _LOGGER.debug(
@@ -229,10 +248,16 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
                     "No new consumption to add, but updating last processed date to %s",
                     most_recent_date
                 )
+            self._last_processed_epoch = most_recent_epoch
             self._last_processed_date = most_recent_date
 
-        # Return cumulative value (can be 0 after processing readings with 0 consumption)
-        # Only return None if we've truly never processed any data
+    @property
+    def native_value(self) -> float | None:
+        """Return the cumulative total maintained by the update callback."""
+        # Return None only if we've truly never processed any data; 0 is a
+        # valid state after processing readings with 0 consumption
+        if self._last_processed_date is None and self._cumulative_value == 0:
+            return None
         return self._cumulative_value
 
     @property
@@ -246,6 +271,8 @@ class AguasCoimbraCumulativeSensor(AguasCoimbraSensorBase, RestoreEntity):
 class AguasCoimbraDailySensor(AguasCoimbraSensorBase):
     """Sensor for daily water consumption total."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -265,6 +292,8 @@ class AguasCoimbraDailySensor(AguasCoimbraSensorBase):
 class AguasCoimbraWeeklySensor(AguasCoimbraSensorBase):
     """Sensor for weekly water consumption total."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -284,6 +313,8 @@ class AguasCoimbraWeeklySensor(AguasCoimbraSensorBase):
 class AguasCoimbraMonthlySensor(AguasCoimbraSensorBase):
     """Sensor for monthly water consumption total."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: AguasCoimbraDataUpdateCoordinator,
@@ -3,7 +3,10 @@ import asyncio
 import logging
 import sys
 import json
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from itertools import islice
+from datetime import datetime, time, timedelta
+from operator import itemgetter
 from tests.test_api import AguasCoimbraAPI
 import aiohttp
 
@@ -14,8 +17,13 @@ logging.basicConfig(
 _LOGGER = logging.getLogger(__name__)
 
 
-async def debug_api_structure(username: str, password: str, meter_number: str, subscription_id: str):
-    """Debug the actual structure of API consumption data."""
+async def debug_api_structure(username: str, password: str, meter_number: str, subscription_id: str, verbose: bool = False):
+    """Debug the actual structure of API consumption data.
+
+    Per-reading field dumps are only rendered with verbose=True; at the
+    default level each reading costs one log line instead of a full
+    json.dumps.
+    """
 
     async with aiohttp.ClientSession() as session:
         api = AguasCoimbraAPI(session, username, password)
@@ -33,12 +41,11 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
                 _LOGGER.error("No data returned from API")
                 return
 
-            # Sort by date
-            sorted_data = sorted(
-                data,
-                key=lambda x: datetime.fromisoformat(x["date"].replace("+00:00", "").replace("+01:00", "")),
-                reverse=True,
-            )
+            # Parse each date once, then sort ascending by the parsed value;
+            # the range splits below bisect the same sorted list
+            parsed = [(datetime.fromisoformat(r["date"]), r) for r in data]
+            parsed.sort(key=itemgetter(0))
+            sorted_data = [reading for _, reading in reversed(parsed)]
 
             _LOGGER.info(f"\n{'='*80}")
             _LOGGER.info(f"RAW API DATA STRUCTURE ANALYSIS")
@@ -53,33 +60,31 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
             _LOGGER.info("ALL READINGS (Last 7 days):")
             _LOGGER.info(f"{'='*80}\n")
 
-            # Analyze date ranges
-            now = datetime.now()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            # Analyze date ranges (tz-aware, to compare against the parsed dates)
+            now = datetime.now().astimezone()
+            # Single constructor call instead of the chained replace() builder
+            today_start = datetime.combine(now.date(), time.min, tzinfo=now.tzinfo)
             yesterday_start = today_start - timedelta(days=1)
 
-            today_readings = []
-            yesterday_readings = []
-            other_readings = []
-
             _LOGGER.info(f"Current time: {now}")
             _LOGGER.info(f"Today starts at: {today_start}")
             _LOGGER.info(f"Yesterday starts at: {yesterday_start}\n")
 
-            for reading in sorted_data:
-                date_str = reading["date"]
-                reading_date = datetime.fromisoformat(
-                    date_str.replace("+00:00", "").replace("+01:00", "")
-                )
-                consumption = reading.get("consumption", 0)
-
-                # Categorize by date
-                if reading_date >= today_start:
-                    today_readings.append((date_str, consumption, reading))
-                elif reading_date >= yesterday_start:
-                    yesterday_readings.append((date_str, consumption, reading))
-                else:
-                    other_readings.append((date_str, consumption, reading))
+            # The list is sorted, so locate each cutoff once and slice
+            # contiguous ranges instead of comparing every reading
+            dates = [reading_date for reading_date, _ in parsed]
+            i_yesterday = bisect_left(dates, yesterday_start)
+            i_today = bisect_left(dates, today_start)
+
+            def _rows(section):
+                return [
+                    (reading["date"], reading.get("consumption", 0), reading)
+                    for _, reading in reversed(section)
+                ]
+
+            today_readings = _rows(parsed[i_today:])
+            yesterday_readings = _rows(parsed[i_yesterday:i_today])
+            other_readings = _rows(parsed[:i_yesterday])
 
             # Show today's readings
             _LOGGER.info(f"📅 TODAY's readings ({len(today_readings)}):")
@@ -89,7 +94,8 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
                 today_sum += consumption
                 _LOGGER.info(f"  Date: {date_str}")
                 _LOGGER.info(f"  Consumption: {consumption} L")
-                _LOGGER.info(f"  All fields: {json.dumps(reading, indent=4, default=str)}")
+                if verbose:
+                    _LOGGER.info(f"  All fields: {json.dumps(reading, indent=4, default=str)}")
                 _LOGGER.info("-" * 80)
             _LOGGER.info(f"TODAY's TOTAL (sum): {today_sum} L\n")
 
@@ -101,7 +107,8 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
                 yesterday_sum += consumption
                 _LOGGER.info(f"  Date: {date_str}")
                 _LOGGER.info(f"  Consumption: {consumption} L")
-                _LOGGER.info(f"  All fields: {json.dumps(reading, indent=4, default=str)}")
+                if verbose:
+                    _LOGGER.info(f"  All fields: {json.dumps(reading, indent=4, default=str)}")
                 _LOGGER.info("-" * 80)
             _LOGGER.info(f"YESTERDAY's TOTAL (sum): {yesterday_sum} L\n")
 
@@ -109,7 +116,7 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
             if other_readings:
                 _LOGGER.info(f"📅 OLDER readings ({len(other_readings)}):")
                 _LOGGER.info("-" * 80)
-                for date_str, consumption, _ in other_readings[:5]:  # Show first 5
+                for date_str, consumption, _ in islice(other_readings, 5):  # Show first 5
                     _LOGGER.info(f"  {date_str}: {consumption} L")
                 if len(other_readings) > 5:
                     _LOGGER.info(f"  ... and {len(other_readings) - 5} more")
@@ -163,15 +170,16 @@ async def debug_api_structure(username: str, password: str, meter_number: str, s
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 5:
-        print("Usage: python debug_data_structure.py <email> <password> <meter_number> <subscription_id>")
+    verbose = "--verbose" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--verbose"]
+    if len(args) != 4:
+        print("Usage: python debug_data_structure.py <email> <password> <meter_number> <subscription_id> [--verbose]")
         print("\nExample:")
         print("  python debug_data_structure.py user@example.com mypassword ABC123 sub456")
         sys.exit(1)
 
-    username = sys.argv[1]
-    password = sys.argv[2]
-    meter_number = sys.argv[3]
-    subscription_id = sys.argv[4]
+    username, password, meter_number, subscription_id = args
 
-    asyncio.run(debug_api_structure(username, password, meter_number, subscription_id))
+    asyncio.run(
+        debug_api_structure(username, password, meter_number, subscription_id, verbose)
+    )
@@ -3,9 +3,25 @@ import asyncio
 import logging
 import sys
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import itemgetter
 from tests.test_api import AguasCoimbraAPI
 import aiohttp
 
+try:
+    # C parser; handles the +00:00/+01:00 offsets natively
+    from ciso8601 import parse_datetime as _parse_date
+except ImportError:
+    _parse_date = datetime.fromisoformat
+
+# Bound once; cheaper per iteration than the dict.get method lookup
+_get_consumption = itemgetter("consumption")
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -13,10 +29,23 @@ logging.basicConfig(
 _LOGGER = logging.getLogger(__name__)
 
 
-async def diagnose_consumption(username: str, password: str, meter_number: str, subscription_id: str):
-    """Diagnose consumption data for negative values."""
+async def diagnose_consumption(
+    username: str,
+    password: str,
+    meter_number: str,
+    subscription_id: str,
+    session: aiohttp.ClientSession | None = None,
+):
+    """Diagnose consumption data for negative values.
+
+    Pass a session to reuse its warm connection pool across calls; by
+    default a private one is created and closed with the diagnosis.
+    """
 
-    async with aiohttp.ClientSession() as session:
+    owns_session = session is None
+    if owns_session:
+        session = aiohttp.ClientSession()
+    try:
         api = AguasCoimbraAPI(session, username, password)
 
         try:
@@ -32,21 +61,25 @@ async def diagnose_consumption(username: str, password: str, meter_number: str,
                 _LOGGER.error("No data returned from API")
                 return
 
-            # Sort by date
-            sorted_data = sorted(
-                data,
-                key=lambda x: datetime.fromisoformat(x["date"].replace("+00:00", "").replace("+01:00", "")),
-                reverse=True,
-            )
+            # Parse each date once, then sort by the parsed value; both
+            # analysis loops below reuse the same parsed dates
+            parsed = [(_parse_date(r["date"]), r) for r in data]
+            parsed.sort(key=itemgetter(0), reverse=True)
+            sorted_data = [reading for _, reading in parsed]
 
             # Analyze the data
             _LOGGER.info(f"\n{'='*80}")
             _LOGGER.info(f"CONSUMPTION DATA ANALYSIS (Last 30 days)")
             _LOGGER.info(f"{'='*80}\n")
 
-            now = datetime.now()
+            # tz-aware, to compare against the parsed dates
+            now = datetime.now().astimezone()
             today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
             yesterday_start = today_start - timedelta(days=1)
+            # Epoch-second cutoffs: the per-reading checks become plain
+            # float compares instead of datetime rich comparisons
+            today_ts = today_start.timestamp()
+            yesterday_ts = yesterday_start.timestamp()
 
             total_readings = len(sorted_data)
             negative_count = 0
@@ -59,52 +92,88 @@ async def diagnose_consumption(username: str, password: str, meter_number: str,
 
             negative_readings = []
 
-            _LOGGER.info("Recent readings (newest first):")
-            _LOGGER.info(f"{'Date':<25} {'Consumption (L)':<20} {'Status':<15}")
-            _LOGGER.info("-" * 60)
-
-            for i, reading in enumerate(sorted_data[:10]):  # Show last 10 readings
-                date_str = reading["date"]
-                reading_date = datetime.fromisoformat(
-                    date_str.replace("+00:00", "").replace("+01:00", "")
+            # Bound once for the per-reading loops; %-style args are only
+            # formatted if the record is actually emitted
+            log_info = _LOGGER.info
+            # Checked once so the display-only work below can be skipped
+            # entirely when the logger is filtered to WARNING or above
+            info_enabled = _LOGGER.isEnabledFor(logging.INFO)
+
+            if info_enabled:
+                log_info("Recent readings (newest first):")
+                log_info(f"{'Date':<25} {'Consumption (L)':<20} {'Status':<15}")
+                log_info("-" * 60)
+
+            # Analyze all readings; with NumPy available the counts and
+            # totals are masked reductions and only the ten displayed
+            # readings are visited in Python
+            if np is not None:
+                if info_enabled:
+                    for reading_date, reading in islice(parsed, 10):  # Show last 10 readings
+                        date_str = reading["date"]
+                        consumption = _get_consumption(reading)
+
+                        status = "✓ POSITIVE" if consumption > 0 else ("✗ NEGATIVE" if consumption < 0 else "ZERO")
+                        log_info("%-25s %-20.2f %-15s", date_str, consumption, status)
+
+                count = len(parsed)
+                cons = np.fromiter(
+                    (_get_consumption(reading) for _, reading in parsed),
+                    dtype=np.float64,
+                    count=count,
                 )
-                consumption = reading.get("consumption", 0)
-
-                status = "✓ POSITIVE" if consumption > 0 else ("✗ NEGATIVE" if consumption < 0 else "ZERO")
-                _LOGGER.info(f"{date_str:<25} {consumption:<20.2f} {status:<15}")
-
-                if consumption < 0:
-                    negative_readings.append((date_str, consumption))
-
-            _LOGGER.info("\n" + "-" * 60)
-            _LOGGER.info("\nFull data analysis:")
-            _LOGGER.info("-" * 60)
-
-            # Analyze all readings
-            for reading in sorted_data:
-                date_str = reading["date"]
-                reading_date = datetime.fromisoformat(
-                    date_str.replace("+00:00", "").replace("+01:00", "")
+                ts = np.fromiter(
+                    (reading_date.timestamp() for reading_date, _ in parsed),
+                    dtype=np.float64,
+                    count=count,
                 )
-                consumption = reading.get("consumption", 0)
-
-                # Count by type
-                if consumption < 0:
-                    negative_count += 1
-                    negative_readings.append((date_str, consumption))
-                elif consumption > 0:
-                    positive_count += 1
-                else:
-                    zero_count += 1
-
-                # Calculate totals
-                all_time_total += consumption
-
-                if reading_date >= today_start:
-                    today_total += consumption
-
-                if reading_date >= yesterday_start and reading_date < today_start:
-                    yesterday_total += consumption
+                neg_mask = cons < 0
+                negative_count = int(neg_mask.sum())
+                positive_count = int((cons > 0).sum())
+                zero_count = count - negative_count - positive_count
+                all_time_total = float(cons.sum())
+                today_total = float(cons[ts >= today_ts].sum())
+                yesterday_total = float(cons[(ts >= yesterday_ts) & (ts < today_ts)].sum())
+                # Built solely from the mask; appending inside the display
+                # loop as well would list early negatives twice
+                negative_readings = [
+                    (sorted_data[i]["date"], float(cons[i]))
+                    for i in np.nonzero(neg_mask)[0]
+                ]
+            else:
+                # Single fused pass: the first ten iterations also emit the
+                # display line, so the list is walked once instead of twice
+                for i, (reading_date, reading) in enumerate(parsed):
+                    date_str = reading["date"]
+                    reading_ts = reading_date.timestamp()
+                    consumption = _get_consumption(reading)
+
+                    if info_enabled and i < 10:  # Show last 10 readings
+                        status = "✓ POSITIVE" if consumption > 0 else ("✗ NEGATIVE" if consumption < 0 else "ZERO")
+                        log_info("%-25s %-20.2f %-15s", date_str, consumption, status)
+
+                    # Count by type
+                    if consumption < 0:
+                        negative_count += 1
+                        negative_readings.append((date_str, consumption))
+                    elif consumption > 0:
+                        positive_count += 1
+                    else:
+                        zero_count += 1
+
+                    # Calculate totals
+                    all_time_total += consumption
+
+                    if reading_ts >= today_ts:
+                        today_total += consumption
+
+                    if yesterday_ts <= reading_ts < today_ts:
+                        yesterday_total += consumption
+
+            if info_enabled:
+                _LOGGER.info("\n" + "-" * 60)
+                _LOGGER.info("\nFull data analysis:")
+                _LOGGER.info("-" * 60)
 
             # Print summary
             _LOGGER.info(f"\nTotal readings: {total_readings}")
@@ -124,8 +193,9 @@ async def diagnose_consumption(username: str, password: str, meter_number: str,
                 _LOGGER.warning(f"⚠️  FOUND {negative_count} NEGATIVE VALUES!")
                 _LOGGER.warning(f"{'='*60}")
                 _LOGGER.warning("\nAll negative readings:")
-                for date_str, value in negative_readings[:20]:  # Show up to 20
-                    _LOGGER.warning(f"  {date_str:<25} {value:>10.2f} L")
+                log_warning = _LOGGER.warning
+                for date_str, value in islice(negative_readings, 20):  # Show up to 20
+                    log_warning("  %-25s %10.2f L", date_str, value)
 
                 if len(negative_readings) > 20:
                     _LOGGER.warning(f"\n  ... and {len(negative_readings) - 20} more negative values")
@@ -148,6 +218,9 @@ Options to handle this:
 
         except Exception as e:
             _LOGGER.error(f"Error during diagnosis: {e}", exc_info=True)
+    finally:
+        if owns_session:
+            await session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+"""Shared date parsing for the test scripts."""
+from datetime import datetime
+
+try:
+    # C parser; handles the +00:00/+01:00 offsets natively, so no
+    # string stripping is needed before parsing
+    from ciso8601 import parse_datetime as parse_date
+except ImportError:
+    parse_date = datetime.fromisoformat
@@ -0,0 +1,20 @@
+"""Shared .envrc credential loading for the test scripts."""
+import functools
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=1)
+def load_envrc(path: str = ".envrc") -> dict[str, str]:
+    """Parse KEY=value lines from an .envrc file into a dict.
+
+    Comment lines are skipped and surrounding quotes are stripped from
+    values. Cached so repeated callers in one process read the file once;
+    str.partition splits each line in a single C call.
+    """
+    return {
+        key.strip(): value.strip().strip("'\"")
+        for key, sep, value in (
+            line.partition("=") for line in Path(path).read_text().splitlines()
+        )
+        if sep and not key.lstrip().startswith("#")
+    }
@@ -0,0 +1,34 @@
+"""Shared aiohttp session for the test scripts."""
+import aiohttp
+
+_session: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use.
+
+    All scripts talk to the same host, so one session means one
+    TCP+TLS handshake reused across every request in a run.
+    """
+    global _session
+    if _session is None or _session.closed:
+        # Default keepalive (15s) drops the idle connection between
+        # sequential test steps; 75s matches common server-side nginx
+        # keepalive so the TCP+TLS session survives the whole run
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session, if one was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
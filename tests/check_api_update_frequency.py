@@ -1,7 +1,10 @@
 """Check how frequently the Águas de Coimbra API provides new readings."""
 import asyncio
+import heapq
 from datetime import datetime
+from operator import itemgetter
 import aiohttp
+from ._envrc import load_envrc
 from .test_api import AguasCoimbraAPI
 
 
@@ -13,14 +16,7 @@ async def check_api_updates():
 
     # Get credentials
     try:
-        with open('.envrc', 'r') as f:
-            lines = f.readlines()
-            credentials = {}
-            for line in lines:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    credentials[key] = value.strip("'\"")
-
+        credentials = load_envrc()
         username = credentials.get('LOGIN_USERNAME', '')
         password = credentials.get('LOGIN_PASSWORD', '')
     except FileNotFoundError:
@@ -34,7 +30,11 @@ async def check_api_updates():
         print("\n❌ Missing required information")
         return
 
-    async with aiohttp.ClientSession() as session:
+    # Default keepalive would idle-close the pooled connection during the
+    # two-minute wait; a longer timeout lets FETCH #2 reuse the warm
+    # TCP+TLS connection instead of handshaking again
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
         api = AguasCoimbraAPI(session, username, password)
 
         try:
@@ -51,19 +51,16 @@ async def check_api_updates():
                 print("❌ No data received")
                 return
 
-            # Sort by date (most recent first)
-            sorted1 = sorted(
-                data1,
-                key=lambda x: x["date"],
-                reverse=True
-            )
+            # Only the three most recent readings are displayed, so select
+            # them directly instead of sorting the whole week of data
+            top1 = heapq.nlargest(3, data1, key=itemgetter("date"))
 
             print(f"✅ Retrieved {len(data1)} readings")
             print(f"\n   Most recent 3 readings:")
-            for i, reading in enumerate(sorted1[:3], 1):
+            for i, reading in enumerate(top1, 1):
                 print(f"      {i}. {reading['date']} - {reading['consumption']}L")
 
-            most_recent_date_1 = sorted1[0]["date"] if sorted1 else None
+            most_recent_date_1 = top1[0]["date"] if top1 else None
             print(f"\n   Most recent reading date: {most_recent_date_1}")
 
             # WAIT 2 MINUTES
@@ -80,18 +77,14 @@ async def check_api_updates():
             print("="*70)
             data2 = await api.get_consumption(meter_number, subscription_id, days=7)
 
-            sorted2 = sorted(
-                data2,
-                key=lambda x: x["date"],
-                reverse=True
-            )
+            top2 = heapq.nlargest(3, data2, key=itemgetter("date"))
 
             print(f"✅ Retrieved {len(data2)} readings")
             print(f"\n   Most recent 3 readings:")
-            for i, reading in enumerate(sorted2[:3], 1):
+            for i, reading in enumerate(top2, 1):
                 print(f"      {i}. {reading['date']} - {reading['consumption']}L")
 
-            most_recent_date_2 = sorted2[0]["date"] if sorted2 else None
+            most_recent_date_2 = top2[0]["date"] if top2 else None
             print(f"\n   Most recent reading date: {most_recent_date_2}")
 
             # COMPARE
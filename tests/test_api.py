@@ -1,12 +1,25 @@
 """Standalone API client for testing (no Home Assistant dependencies)."""
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bounds concurrent requests when callers fan out with asyncio.gather,
+# keeping discovery loops from tripping server-side rate limits
+_API_SEMA = asyncio.Semaphore(8)
+# Retries on 429/5xx with exponential backoff (1s, 2s, 4s)
+_MAX_ATTEMPTS = 4
+
+
+def _transient(status: int) -> bool:
+    """Return True for statuses worth retrying with backoff."""
+    return status == 429 or status >= 500
+
 # Constants
 BASE_URL = "https://bdigital.aguasdecoimbra.pt/uPortal2/coimbra"
 API_KEY = "fj894y82-h351-5f11-89f3-u2389ru893n1"
@@ -54,6 +67,7 @@ class AguasCoimbraAPI:
         self._username = username
         self._password = password
         self._auth_token: str | None = None
+        self._auth_headers: dict[str, str] | None = None
 
     async def login(self) -> str:
         """Authenticate and obtain X-Auth-Token."""
@@ -91,6 +105,8 @@ class AguasCoimbraAPI:
                     raise LoginError(f"Login failed with status {response.status}")
 
                 self._auth_token = auth_token
+                # Rebuilt lazily with the new token
+                self._auth_headers = None
                 _LOGGER.debug("Successfully authenticated with Águas de Coimbra")
                 return auth_token
 
@@ -98,38 +114,62 @@ class AguasCoimbraAPI:
             _LOGGER.error("Connection error during login: %s", err)
             raise ConnectionError("Failed to connect to Águas de Coimbra") from err
 
+    @property
+    def auth_headers(self) -> dict[str, str]:
+        """Authenticated GET headers, rebuilt only when the token changes."""
+        if self._auth_headers is None:
+            self._auth_headers = {
+                HEADER_API_KEY: API_KEY,
+                HEADER_AUTH_TOKEN: self._auth_token,
+                HEADER_ACCEPT: "application/json",
+            }
+        return self._auth_headers
+
     async def get_user_subscriptions(self) -> list[dict[str, Any]]:
         """Get user subscriptions after login."""
         if not self._auth_token:
             await self.login()
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
+        relogin_done = False
 
         try:
-            async with self._session.get(
-                ENDPOINT_SUBSCRIPTIONS,
-                headers=headers,
-            ) as response:
-                if response.status == 401:
+            for attempt in range(_MAX_ATTEMPTS):
+                # Re-read each attempt: re-login invalidates the memoized dict
+                headers = self.auth_headers
+                async with _API_SEMA, self._session.get(
+                    ENDPOINT_SUBSCRIPTIONS,
+                    headers=headers,
+                ) as response:
+                    status = response.status
+                    retry = attempt + 1 < _MAX_ATTEMPTS and (
+                        _transient(status) or (status == 401 and not relogin_done)
+                    )
+                    if not retry:
+                        if status != 200:
+                            _LOGGER.warning(
+                                "Failed to get subscriptions with status %s: %s",
+                                status,
+                                await response.text(),
+                            )
+                            return []
+
+                        data = orjson.loads(await response.read())
+                        _LOGGER.debug("Retrieved %d subscription(s)", len(data) if isinstance(data, list) else 0)
+                        return data if isinstance(data, list) else []
+
+                # Retry with the permit and response released, so the
+                # follow-up I/O doesn't starve concurrent requests or
+                # pin a pooled connection
+                if status == 401:
+                    # Token expired; re-authenticate once, then retry
                     _LOGGER.warning("Auth token expired, re-authenticating")
                     await self.login()
-                    return await self.get_user_subscriptions()
-
-                if response.status != 200:
-                    _LOGGER.warning(
-                        "Failed to get subscriptions with status %s: %s",
-                        response.status,
-                        await response.text(),
-                    )
-                    return []
-
-                data = await response.json()
-                _LOGGER.debug("Retrieved %d subscription(s)", len(data) if isinstance(data, list) else 0)
-                return data if isinstance(data, list) else []
+                    relogin_done = True
+                    continue
+                _LOGGER.warning(
+                    "Transient HTTP %s, retrying in %ds", status, 2**attempt
+                )
+                await asyncio.sleep(2**attempt)
 
         except aiohttp.ClientError as err:
             _LOGGER.warning("Connection error getting subscriptions: %s", err)
@@ -140,39 +180,51 @@ class AguasCoimbraAPI:
         if not self._auth_token:
             await self.login()
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
-
         params = {"subscriptionId": subscription_id}
 
+        relogin_done = False
+
         try:
-            async with self._session.get(
-                ENDPOINT_METERS,
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status == 401:
-                    # Token expired, re-authenticate
+            for attempt in range(_MAX_ATTEMPTS):
+                # Re-read each attempt: re-login invalidates the memoized dict
+                headers = self.auth_headers
+                async with _API_SEMA, self._session.get(
+                    ENDPOINT_METERS,
+                    headers=headers,
+                    params=params,
+                ) as response:
+                    status = response.status
+                    retry = attempt + 1 < _MAX_ATTEMPTS and (
+                        _transient(status) or (status == 401 and not relogin_done)
+                    )
+                    if not retry:
+                        if status != 200:
+                            _LOGGER.error(
+                                "Failed to get meters with status %s: %s",
+                                status,
+                                await response.text(),
+                            )
+                            raise InvalidResponseError(
+                                f"Failed to get meters: HTTP {status}"
+                            )
+
+                        data = orjson.loads(await response.read())
+                        _LOGGER.debug("Retrieved %d meters", len(data) if isinstance(data, list) else 0)
+                        return data if isinstance(data, list) else []
+
+                # Retry with the permit and response released, so the
+                # follow-up I/O doesn't starve concurrent requests or
+                # pin a pooled connection
+                if status == 401:
+                    # Token expired; re-authenticate once, then retry
                     _LOGGER.warning("Auth token expired, re-authenticating")
                     await self.login()
-                    return await self.get_meters(subscription_id)
-
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to get meters with status %s: %s",
-                        response.status,
-                        await response.text(),
-                    )
-                    raise InvalidResponseError(
-                        f"Failed to get meters: HTTP {response.status}"
-                    )
-
-                data = await response.json()
-                _LOGGER.debug("Retrieved %d meters", len(data) if isinstance(data, list) else 0)
-                return data if isinstance(data, list) else []
+                    relogin_done = True
+                    continue
+                _LOGGER.warning(
+                    "Transient HTTP %s, retrying in %ds", status, 2**attempt
+                )
+                await asyncio.sleep(2**attempt)
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Connection error getting meters: %s", err)
@@ -192,12 +244,6 @@ class AguasCoimbraAPI:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        headers = {
-            HEADER_API_KEY: API_KEY,
-            HEADER_AUTH_TOKEN: self._auth_token,
-            HEADER_ACCEPT: "application/json",
-        }
-
         params = {
             "codigoMarca": DEFAULT_BRAND_CODE,
             "codigoProduto": DEFAULT_PRODUCT_CODE,
@@ -207,36 +253,54 @@ class AguasCoimbraAPI:
             "finalDate": end_date.strftime("%Y-%m-%d"),
         }
 
+        relogin_done = False
+
         try:
-            async with self._session.get(
-                ENDPOINT_CONSUMPTION,
-                headers=headers,
-                params=params,
-            ) as response:
-                if response.status == 401:
-                    # Token expired, re-authenticate
+            for attempt in range(_MAX_ATTEMPTS):
+                # Re-read each attempt: re-login invalidates the memoized dict
+                headers = self.auth_headers
+                async with _API_SEMA, self._session.get(
+                    ENDPOINT_CONSUMPTION,
+                    headers=headers,
+                    params=params,
+                ) as response:
+                    status = response.status
+                    retry = attempt + 1 < _MAX_ATTEMPTS and (
+                        _transient(status) or (status == 401 and not relogin_done)
+                    )
+                    if not retry:
+                        if status != 200:
+                            _LOGGER.error(
+                                "Failed to get consumption with status %s: %s",
+                                status,
+                                await response.text(),
+                            )
+                            raise InvalidResponseError(
+                                f"Failed to get consumption: HTTP {status}"
+                            )
+
+                        data = orjson.loads(await response.read())
+
+                        if not isinstance(data, list):
+                            _LOGGER.error("Unexpected response format: %s", type(data))
+                            raise InvalidResponseError("Invalid response format")
+
+                        _LOGGER.debug("Retrieved %d consumption readings", len(data))
+                        return data
+
+                # Retry with the permit and response released, so the
+                # follow-up I/O doesn't starve concurrent requests or
+                # pin a pooled connection
+                if status == 401:
+                    # Token expired; re-authenticate once, then retry
                     _LOGGER.warning("Auth token expired, re-authenticating")
                     await self.login()
-                    return await self.get_consumption(meter_number, subscription_id, days)
-
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to get consumption with status %s: %s",
-                        response.status,
-                        await response.text(),
-                    )
-                    raise InvalidResponseError(
-                        f"Failed to get consumption: HTTP {response.status}"
-                    )
-
-                data = await response.json()
-
-                if not isinstance(data, list):
-                    _LOGGER.error("Unexpected response format: %s", type(data))
-                    raise InvalidResponseError("Invalid response format")
-
-                _LOGGER.debug("Retrieved %d consumption readings", len(data))
-                return data
+                    relogin_done = True
+                    continue
+                _LOGGER.warning(
+                    "Transient HTTP %s, retrying in %ds", status, 2**attempt
+                )
+                await asyncio.sleep(2**attempt)
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Connection error getting consumption: %s", err)
@@ -1,11 +1,27 @@
 """Simple test of cumulative sensor logic with mock data."""
 from datetime import datetime, timedelta
 
+try:
+    # C parser; handles the +00:00/+01:00 offsets natively
+    from ciso8601 import parse_datetime as _parse_date
+except ImportError:
+    _parse_date = datetime.fromisoformat
+
 
 def simulate_cumulative_sensor(readings_list, initial_cumulative=0, initial_last_date=None):
-    """Simulate the cumulative sensor logic."""
+    """Simulate the cumulative sensor logic.
+
+    readings_list must be sorted most recent first (the coordinator
+    guarantees this); the loop stops at the first already-processed
+    reading instead of comparing every remaining one.
+    """
     _cumulative_value = initial_cumulative
     _last_processed_date = initial_last_date
+    # Epoch-seconds mirror of the last processed date; per-reading
+    # comparisons are O(1) float compares, safe across offset changes
+    _last_processed_ts = (
+        _parse_date(initial_last_date).timestamp() if initial_last_date else None
+    )
 
     print(f"\n{'='*60}")
     print(f"INITIAL STATE:")
@@ -17,32 +33,36 @@ def simulate_cumulative_sensor(readings_list, initial_cumulative=0, initial_last
     # Calculate incremental consumption from NEW readings only
     incremental = 0.0
     most_recent_date = _last_processed_date
+    most_recent_ts = _last_processed_ts
     processed = 0
     skipped = 0
 
     for reading in readings_list:
+        # dict.get keeps malformed readings on the skip path; this
+        # simulator has no exception handler to catch a KeyError
         reading_date_str = reading.get("date", "")
         if not reading_date_str:
             continue
 
-        # Normalize the date string
-        reading_date_str_clean = reading_date_str.replace("+00:00", "").replace("+01:00", "")
+        # Parse once and compare timestamps; lexicographic string
+        # comparison breaks if offsets differ between readings
+        reading_ts = _parse_date(reading_date_str).timestamp()
 
-        # If we have a last processed date, only count readings newer than it
-        if _last_processed_date:
-            if reading_date_str_clean <= _last_processed_date:
-                skipped += 1
-                continue  # Skip already processed readings
+        # Input is sorted newest first, so everything from the first
+        # already-processed reading onwards has been counted before
+        if _last_processed_ts is not None and reading_ts <= _last_processed_ts:
+            skipped = len(readings_list) - processed
+            break
 
         # Add this reading's consumption
-        consumption = reading.get("consumption", 0)
-        incremental += consumption
+        incremental += reading.get("consumption", 0)
+        # Newest-first input: the first processed reading is the most
+        # recent one, so no running max is needed
+        if processed == 0:
+            most_recent_ts = reading_ts
+            most_recent_date = reading_date_str
         processed += 1
 
-        # Track the most recent reading date
-        if most_recent_date is None or reading_date_str_clean > most_recent_date:
-            most_recent_date = reading_date_str_clean
-
     print(f"\nPROCESSING:")
     print(f"  Processed: {processed} readings")
     print(f"  Skipped: {skipped} readings")
@@ -50,7 +70,7 @@ def simulate_cumulative_sensor(readings_list, initial_cumulative=0, initial_last
 
     # Update cumulative value and last processed date (FIXED VERSION)
     # Important: Update last_processed_date even if incremental is 0
-    if most_recent_date is not None and most_recent_date != _last_processed_date:
+    if most_recent_ts is not None and most_recent_ts != _last_processed_ts:
         if incremental > 0:
             _cumulative_value += incremental
             print(f"\nUPDATED:")
@@ -60,6 +80,7 @@ def simulate_cumulative_sensor(readings_list, initial_cumulative=0, initial_last
             print(f"\nUPDATED (no consumption but marking readings as processed):")
             print(f"  ✅ Last processed: {most_recent_date}")
         _last_processed_date = most_recent_date
+        _last_processed_ts = most_recent_ts
     else:
         print(f"\n⚠️  NO UPDATE (no new readings)")
 
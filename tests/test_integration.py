@@ -1,38 +1,49 @@
 """Test script for Águas de Coimbra integration."""
 import asyncio
+import traceback
+import functools
 import sys
 import os
 from datetime import datetime, timedelta
+from operator import itemgetter
 
-import aiohttp
 
 # Import the standalone test API (no Home Assistant dependencies)
+from ._dates import parse_date
+from ._envrc import load_envrc
+from ._session import close_session, get_session
 from .test_api import AguasCoimbraAPI, LoginError, ConnectionError as APIConnectionError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-async def test_login(username: str, password: str):
-    """Test login functionality."""
+# The API repeats identical timestamps across overlapping fetches, so a
+# repeated string costs one dict lookup instead of a full ISO parse
+_parse_date = functools.lru_cache(maxsize=4096)(parse_date)
+
+
+async def test_login(api: AguasCoimbraAPI):
+    """Test login on the caller's API client."""
     print("\n" + "=" * 60)
     print("TEST 1: Authentication")
     print("=" * 60)
 
-    async with aiohttp.ClientSession() as session:
-        api = AguasCoimbraAPI(session, username, password)
-
-        try:
-            token = await api.login()
-            print(f"✅ Login successful!")
-            print(f"   X-Auth-Token: {token[:20]}...{token[-20:]}")
-            return api
-        except LoginError as e:
-            print(f"❌ Login failed: {e}")
-            return None
-        except APIConnectionError as e:
-            print(f"❌ Connection error: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            return None
+    try:
+        token = await api.login()
+        print(f"✅ Login successful!")
+        print(f"   X-Auth-Token: {token[:20]}...{token[-20:]}")
+        return api
+    except LoginError as e:
+        print(f"❌ Login failed: {e}")
+        return None
+    except APIConnectionError as e:
+        print(f"❌ Connection error: {e}")
+        return None
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return None
 
 
 async def test_get_meters(api: AguasCoimbraAPI, subscription_id: str):
@@ -46,9 +57,11 @@ async def test_get_meters(api: AguasCoimbraAPI, subscription_id: str):
         print(f"✅ Successfully retrieved {len(meters)} meter(s)")
 
         for i, meter in enumerate(meters, 1):
-            print(f"\n   Meter {i}:")
-            for key, value in meter.items():
-                print(f"      {key}: {value}")
+            # One write per meter instead of one per field
+            print(
+                f"\n   Meter {i}:\n"
+                + "\n".join(f"      {key}: {value}" for key, value in meter.items())
+            )
 
         return meters
     except Exception as e:
@@ -90,7 +103,6 @@ async def test_get_consumption(
         return consumption_data
     except Exception as e:
         print(f"❌ Failed to get consumption: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
@@ -105,45 +117,71 @@ async def test_data_processing(consumption_data: list):
         print("⚠️  No data to process")
         return
 
-    # Sort by date (most recent first)
-    sorted_data = sorted(
-        consumption_data,
-        key=lambda x: datetime.fromisoformat(x["date"].replace("+00:00", "").replace("+01:00", "")),
-        reverse=True,
-    )
+    # Parse each date once up front (the shared parser understands the
+    # offsets, so no suffix stripping is needed); the sort and the totals
+    # loop below reuse the same parsed values, and malformed readings are
+    # filtered here so the hot loop needs no exception handling
+    parsed = []
+    for reading in consumption_data:
+        try:
+            # Epoch seconds instead of datetimes: the totals loop then
+            # runs on plain float compares
+            parsed.append(
+                (
+                    _parse_date(reading["date"]).timestamp(),
+                    reading.get("consumption", 0),
+                    reading,
+                )
+            )
+        except (ValueError, KeyError, TypeError):
+            continue
+    # Most recent first, keyed on the parsed date at C level
+    parsed.sort(key=itemgetter(0), reverse=True)
 
     # Get latest reading
-    latest = sorted_data[0] if sorted_data else None
+    latest = parsed[0][2] if parsed else None
     latest_reading = latest["consumption"] if latest else None
     last_reading_date = latest["date"] if latest else None
     cil = latest.get("cil") if latest else None
 
-    # Calculate date ranges
-    now = datetime.now()
+    # Calculate date ranges (tz-aware, to compare against the parsed dates)
+    now = datetime.now().astimezone()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=7)
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    # Calculate totals
-    daily_total = 0
-    weekly_total = 0
-    monthly_total = 0
-
-    for reading in sorted_data:
-        try:
-            reading_date = datetime.fromisoformat(
-                reading["date"].replace("+00:00", "").replace("+01:00", "")
-            )
-            consumption = reading.get("consumption", 0)
-
-            if reading_date >= today_start:
+    today_ts = today_start.timestamp()
+    week_ts = week_start.timestamp()
+    month_ts = month_start.timestamp()
+
+    # Calculate totals; with NumPy the three window sums are masked
+    # reductions over two parallel arrays instead of a Python loop
+    if np is not None:
+        count = len(parsed)
+        ts = np.fromiter(
+            (reading_ts for reading_ts, _, _ in parsed),
+            dtype=np.float64,
+            count=count,
+        )
+        vals = np.fromiter(
+            (consumption for _, consumption, _ in parsed),
+            dtype=np.float64,
+            count=count,
+        )
+        daily_total = float(vals[ts >= today_ts].sum())
+        weekly_total = float(vals[ts >= week_ts].sum())
+        monthly_total = float(vals[ts >= month_ts].sum())
+    else:
+        daily_total = 0
+        weekly_total = 0
+        monthly_total = 0
+
+        for reading_ts, consumption, _ in parsed:
+            if reading_ts >= today_ts:
                 daily_total += consumption
-            if reading_date >= week_start:
+            if reading_ts >= week_ts:
                 weekly_total += consumption
-            if reading_date >= month_start:
+            if reading_ts >= month_ts:
                 monthly_total += consumption
-        except (ValueError, KeyError):
-            continue
 
     print(f"✅ Data processed successfully")
     print(f"\n   Latest Reading:")
@@ -168,14 +206,7 @@ async def main():
     password = ""
 
     try:
-        with open('.envrc', 'r') as f:
-            lines = f.readlines()
-            credentials = {}
-            for line in lines:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    credentials[key] = value.strip("'\"")
-
+        credentials = load_envrc()
         username = credentials.get('LOGIN_USERNAME', '')
         password = credentials.get('LOGIN_PASSWORD', '')
 
@@ -201,34 +232,29 @@ async def main():
     print(f"   Subscription ID: {subscription_id}")
     print(f"   Meter Number: {meter_number}")
 
-    # Run tests
-    async with aiohttp.ClientSession() as session:
+    # Run tests over the shared session (one handshake for the run)
+    session = await get_session()
+    try:
         api = AguasCoimbraAPI(session, username, password)
 
-        # Test 1: Login
-        if not await test_login(username, password):
+        # Test 1: Login (the same authenticated client runs the rest)
+        if not await test_login(api):
             print("\n❌ Cannot continue - login failed")
             return
 
-        # Re-create API with session
-        api = AguasCoimbraAPI(session, username, password)
-        await api.login()
-
-        # Test 2: Get meters (optional, might fail if endpoint needs discovery)
+        # Tests 2 and 3: independent endpoints, so overlap the two
+        # network calls instead of paying their latencies back to back
         print("\n⚠️  Attempting to fetch meters (may fail - this is optional)")
-        await test_get_meters(api, subscription_id)
-
-        # Test 3: Get consumption
-        consumption_data = await test_get_consumption(
-            api,
-            meter_number,
-            subscription_id,
-            days=30
+        _, consumption_data = await asyncio.gather(
+            test_get_meters(api, subscription_id),
+            test_get_consumption(api, meter_number, subscription_id, days=30),
         )
 
         # Test 4: Process data
         if consumption_data:
             await test_data_processing(consumption_data)
+    finally:
+        await close_session()
 
     print("\n" + "=" * 60)
     print("Test Complete!")
@@ -238,11 +264,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout (TTYs default to line buffering): the meter and
+    # reading dumps then coalesce into few large writes instead of one
+    # syscall per line. input() still flushes before prompting.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
         traceback.print_exc()
@@ -1,6 +1,11 @@
 """Test the listSubscriptions endpoint."""
 import asyncio
+import traceback
+import sys
 import aiohttp
+import orjson
+from ._envrc import load_envrc
+from ._session import close_session, get_session
 from .test_api import AguasCoimbraAPI
 
 BASE_URL = "https://bdigital.aguasdecoimbra.pt/uPortal2/coimbra"
@@ -17,11 +22,8 @@ async def test_list_subscriptions(api: AguasCoimbraAPI):
     if not api._auth_token:
         await api.login()
 
-    headers = {
-        "api-key": API_KEY,
-        "X-Auth-Token": api._auth_token,
-        "Accept": "application/json",
-    }
+    # Memoized on the client; one dict shared across requests
+    headers = api.auth_headers
 
     try:
         async with api._session.get(
@@ -31,7 +33,7 @@ async def test_list_subscriptions(api: AguasCoimbraAPI):
             print(f"\nStatus: {response.status}")
 
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 print(f"✅ SUCCESS! Received data")
                 print(f"   Response type: {type(data)}")
 
@@ -39,12 +41,16 @@ async def test_list_subscriptions(api: AguasCoimbraAPI):
                     print(f"   Number of subscriptions: {len(data)}")
 
                     for i, sub in enumerate(data, 1):
-                        print(f"\n   Subscription {i}:")
-                        for key, value in sub.items():
-                            if isinstance(value, (str, int, float, bool)):
-                                print(f"      {key}: {value}")
-                            else:
-                                print(f"      {key}: {type(value).__name__}")
+                        # One write per subscription instead of one per field
+                        print(
+                            f"\n   Subscription {i}:\n"
+                            + "\n".join(
+                                f"      {key}: {value}"
+                                if isinstance(value, (str, int, float, bool))
+                                else f"      {key}: {type(value).__name__}"
+                                for key, value in sub.items()
+                            )
+                        )
 
                         # Look for subscription ID
                         sub_id = sub.get('subscriptionId') or sub.get('id') or sub.get('idSubscription')
@@ -52,9 +58,10 @@ async def test_list_subscriptions(api: AguasCoimbraAPI):
                             print(f"\n      ⭐ Subscription ID: {sub_id}")
 
                 elif isinstance(data, dict):
-                    print(f"\n   Data:")
-                    for key, value in data.items():
-                        print(f"      {key}: {value}")
+                    print(
+                        "\n   Data:\n"
+                        + "\n".join(f"      {key}: {value}" for key, value in data.items())
+                    )
 
                 return data
             else:
@@ -65,7 +72,6 @@ async def test_list_subscriptions(api: AguasCoimbraAPI):
 
     except Exception as e:
         print(f"❌ ERROR: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -78,14 +84,7 @@ async def main():
 
     # Get credentials
     try:
-        with open('.envrc', 'r') as f:
-            lines = f.readlines()
-            credentials = {}
-            for line in lines:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    credentials[key] = value.strip("'\"")
-
+        credentials = load_envrc()
         username = credentials.get('LOGIN_USERNAME', '')
         password = credentials.get('LOGIN_PASSWORD', '')
 
@@ -102,7 +101,9 @@ async def main():
     print(f"\nTesting with:")
     print(f"   Username: {username}")
 
-    async with aiohttp.ClientSession() as session:
+    # Shared session: one handshake for the run
+    session = await get_session()
+    try:
         api = AguasCoimbraAPI(session, username, password)
 
         # Login
@@ -139,14 +140,19 @@ async def main():
             print("=" * 70)
             print("\nThe /Subscription/listSubscriptions endpoint doesn't work.")
             print("We'll need to use manual entry or find another method.")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout (TTYs default to line buffering): the meter and
+    # reading dumps then coalesce into few large writes instead of one
+    # syscall per line. input() still flushes before prompting.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
         traceback.print_exc()
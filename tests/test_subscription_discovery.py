@@ -1,16 +1,53 @@
 """Test subscription ID discovery methods."""
 import asyncio
+import traceback
 import sys
 from datetime import datetime
+from itertools import islice
 
 import aiohttp
+import orjson
 
+from ._envrc import load_envrc
+from ._session import close_session, get_session
 from .test_api import AguasCoimbraAPI
 
 # Constants
 BASE_URL = "https://bdigital.aguasdecoimbra.pt/uPortal2/coimbra"
 API_KEY = "fj894y82-h351-5f11-89f3-u2389ru893n1"
 
+# Candidate keys for the subscription ID, probed in order
+_SUB_ID_KEYS = ('subscriptionId', 'idSubscription', 'subscription_id')
+
+
+def _meter_number_of(meter: dict) -> str | None:
+    """Return the meter number from either known layout."""
+    chave = meter.get('chaveContador')
+    if isinstance(chave, dict):
+        return chave.get('numeroContador')
+    return meter.get('numeroContador')
+
+
+def _build_meter_index(meter_data: list) -> dict:
+    """Index meters by number so repeated lookups are O(1) dict gets.
+
+    Cached per meter list, so rescans of the same payload skip both the
+    index build and the per-meter key probing.
+    """
+    cached = _build_meter_index._cache
+    if cached is not None and cached[0] is meter_data:
+        return cached[1]
+    index = {
+        number: meter
+        for meter in meter_data
+        if (number := _meter_number_of(meter)) is not None
+    }
+    _build_meter_index._cache = (meter_data, index)
+    return index
+
+
+_build_meter_index._cache = None
+
 
 async def test_meters_no_subscription(api: AguasCoimbraAPI):
     """Test calling meters endpoint WITHOUT subscription ID."""
@@ -23,11 +60,8 @@ async def test_meters_no_subscription(api: AguasCoimbraAPI):
     if not api._auth_token:
         await api.login()
 
-    headers = {
-        "api-key": API_KEY,
-        "X-Auth-Token": api._auth_token,
-        "Accept": "application/json",
-    }
+    # Memoized on the client; one dict shared across requests
+    headers = api.auth_headers
 
     try:
         async with api._session.get(
@@ -37,7 +71,7 @@ async def test_meters_no_subscription(api: AguasCoimbraAPI):
             print(f"\nStatus: {response.status}")
 
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 print(f"✅ SUCCESS! Received data")
                 print(f"   Response type: {type(data)}")
 
@@ -49,29 +83,22 @@ async def test_meters_no_subscription(api: AguasCoimbraAPI):
                         print(f"      Keys: {list(meter.keys())}")
 
                         # Look for subscription ID in various possible locations
-                        sub_id = None
-                        if 'subscriptionId' in meter:
-                            sub_id = meter['subscriptionId']
-                        elif 'idSubscription' in meter:
-                            sub_id = meter['idSubscription']
-                        elif 'subscription' in meter and isinstance(meter['subscription'], dict):
+                        sub_id = next(
+                            (meter[k] for k in _SUB_ID_KEYS if k in meter), None
+                        )
+                        if sub_id is None and isinstance(meter.get('subscription'), dict):
                             sub_id = meter['subscription'].get('id')
 
                         if sub_id:
                             print(f"      ⭐ FOUND SUBSCRIPTION ID: {sub_id}")
 
                         # Show meter number
-                        meter_num = None
-                        if 'chaveContador' in meter and isinstance(meter['chaveContador'], dict):
-                            meter_num = meter['chaveContador'].get('numeroContador')
-                        elif 'numeroContador' in meter:
-                            meter_num = meter['numeroContador']
-
-                        if meter_num:
+                        if meter_num := _meter_number_of(meter):
                             print(f"      Meter Number: {meter_num}")
 
-                        # Show first few keys and values
-                        for key in list(meter.keys())[:5]:
+                        # Show first few keys and values, without
+                        # materializing the full key list
+                        for key in islice(meter, 5):
                             value = meter[key]
                             if isinstance(value, (str, int, float, bool)):
                                 print(f"      {key}: {value}")
@@ -85,7 +112,6 @@ async def test_meters_no_subscription(api: AguasCoimbraAPI):
 
     except Exception as e:
         print(f"❌ ERROR: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -100,11 +126,8 @@ async def test_meters_with_meter_number(api: AguasCoimbraAPI, meter_number: str)
     if not api._auth_token:
         await api.login()
 
-    headers = {
-        "api-key": API_KEY,
-        "X-Auth-Token": api._auth_token,
-        "Accept": "application/json",
-    }
+    # Memoized on the client; one dict shared across requests
+    headers = api.auth_headers
 
     params = {"numeroContador": meter_number}
 
@@ -117,7 +140,7 @@ async def test_meters_with_meter_number(api: AguasCoimbraAPI, meter_number: str)
             print(f"\nStatus: {response.status}")
 
             if response.status == 200:
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 print(f"✅ SUCCESS! Received data")
                 print(f"   Response type: {type(data)}")
 
@@ -128,11 +151,9 @@ async def test_meters_with_meter_number(api: AguasCoimbraAPI, meter_number: str)
                         print(f"\n   Meter {i}:")
 
                         # Look for subscription ID
-                        sub_id = None
-                        for key in ['subscriptionId', 'idSubscription', 'subscription_id']:
-                            if key in meter:
-                                sub_id = meter[key]
-                                break
+                        sub_id = next(
+                            (meter[k] for k in _SUB_ID_KEYS if k in meter), None
+                        )
 
                         if sub_id:
                             print(f"      ⭐ FOUND SUBSCRIPTION ID: {sub_id}")
@@ -149,7 +170,6 @@ async def test_meters_with_meter_number(api: AguasCoimbraAPI, meter_number: str)
 
     except Exception as e:
         print(f"❌ ERROR: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -166,56 +186,48 @@ async def test_extract_subscription_from_meter_data(meter_data: list, meter_numb
 
     print(f"Looking for meter: {meter_number}")
 
-    for meter in meter_data:
-        # Get meter number from data
-        current_meter = None
-
-        if 'chaveContador' in meter and isinstance(meter['chaveContador'], dict):
-            current_meter = meter['chaveContador'].get('numeroContador')
-        elif 'numeroContador' in meter:
-            current_meter = meter['numeroContador']
+    # One O(1) lookup against the cached index instead of a linear scan
+    # with per-meter key probing
+    meter_index = _build_meter_index(meter_data)
+    print(f"Indexed meters: {sorted(meter_index)}")
 
-        print(f"\nChecking meter: {current_meter}")
-
-        if current_meter == meter_number:
-            print(f"✅ Found matching meter!")
-
-            # Try to find subscription ID
-            subscription_id = None
-
-            # Check various possible locations
-            if 'subscriptionId' in meter:
-                subscription_id = meter['subscriptionId']
-                print(f"   Found subscriptionId: {subscription_id}")
-
-            if 'idSubscription' in meter:
-                subscription_id = meter['idSubscription']
-                print(f"   Found idSubscription: {subscription_id}")
-
-            if 'subscription' in meter:
-                if isinstance(meter['subscription'], dict):
-                    subscription_id = meter['subscription'].get('id') or meter['subscription'].get('subscriptionId')
-                    print(f"   Found in subscription object: {subscription_id}")
-                elif isinstance(meter['subscription'], (str, int)):
-                    subscription_id = str(meter['subscription'])
-                    print(f"   Found subscription: {subscription_id}")
-
-            # Check in chaveContador
-            if 'chaveContador' in meter and isinstance(meter['chaveContador'], dict):
-                chave = meter['chaveContador']
-                if 'subscriptionId' in chave:
-                    subscription_id = chave['subscriptionId']
-                    print(f"   Found in chaveContador: {subscription_id}")
-
-            if subscription_id:
-                print(f"\n⭐ SUCCESSFULLY EXTRACTED SUBSCRIPTION ID: {subscription_id}")
-                return str(subscription_id)
-            else:
-                print(f"\n❌ Could not find subscription ID in meter data")
-                print(f"   Available keys: {list(meter.keys())}")
-                return None
+    meter = meter_index.get(meter_number)
+    if meter is None:
+        print(f"\n❌ Meter {meter_number} not found in data")
+        return None
 
-    print(f"\n❌ Meter {meter_number} not found in data")
+    print(f"✅ Found matching meter!")
+
+    # Try to find subscription ID
+    subscription_id = None
+
+    # Check the flat candidate keys first
+    for key in _SUB_ID_KEYS:
+        if key in meter:
+            subscription_id = meter[key]
+            print(f"   Found {key}: {subscription_id}")
+
+    if 'subscription' in meter:
+        if isinstance(meter['subscription'], dict):
+            subscription_id = meter['subscription'].get('id') or meter['subscription'].get('subscriptionId')
+            print(f"   Found in subscription object: {subscription_id}")
+        elif isinstance(meter['subscription'], (str, int)):
+            subscription_id = str(meter['subscription'])
+            print(f"   Found subscription: {subscription_id}")
+
+    # Check in chaveContador
+    if 'chaveContador' in meter and isinstance(meter['chaveContador'], dict):
+        chave = meter['chaveContador']
+        if 'subscriptionId' in chave:
+            subscription_id = chave['subscriptionId']
+            print(f"   Found in chaveContador: {subscription_id}")
+
+    if subscription_id:
+        print(f"\n⭐ SUCCESSFULLY EXTRACTED SUBSCRIPTION ID: {subscription_id}")
+        return str(subscription_id)
+
+    print(f"\n❌ Could not find subscription ID in meter data")
+    print(f"   Available keys: {list(meter.keys())}")
     return None
 
 
@@ -227,14 +239,7 @@ async def main():
 
     # Get credentials
     try:
-        with open('.envrc', 'r') as f:
-            lines = f.readlines()
-            credentials = {}
-            for line in lines:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    credentials[key] = value.strip("'\"")
-
+        credentials = load_envrc()
         username = credentials.get('LOGIN_USERNAME', '')
         password = credentials.get('LOGIN_PASSWORD', '')
 
@@ -254,7 +259,9 @@ async def main():
     print(f"   Username: {username}")
     print(f"   Meter Number: {meter_number}")
 
-    async with aiohttp.ClientSession() as session:
+    # Shared session: one handshake for the run
+    session = await get_session()
+    try:
         api = AguasCoimbraAPI(session, username, password)
 
         # Login
@@ -300,14 +307,19 @@ async def main():
             print("\nCould not retrieve meter data without subscription ID.")
             print("The current implementation with /Subscription/listSubscriptions")
             print("or manual entry is the best option.")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout (TTYs default to line buffering): the meter and
+    # reading dumps then coalesce into few large writes instead of one
+    # syscall per line. input() still flushes before prompting.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Test failed with error: {e}")
-        import traceback
         traceback.print_exc()